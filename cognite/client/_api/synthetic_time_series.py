@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import cognite.client.utils._time
 from cognite.client import utils
 from cognite.client._api_client import APIClient
 from cognite.client.data_classes import Datapoints, DatapointsList, TimeSeries
 
+try:
+    import orjson
+
+    ORJSON_IS_AVAILABLE = True
+
+except ImportError:  # pragma no cover
+    ORJSON_IS_AVAILABLE = False
+
 if TYPE_CHECKING:
     import sympy
 
@@ -16,12 +26,61 @@ if TYPE_CHECKING:
     from cognite.client.config import ClientConfig
 
 
+@functools.lru_cache(maxsize=1024)
+def _variables_pattern(names: Tuple[str, ...]) -> re.Pattern[str]:
+    # Longest names first so that a name is never shadowed by one of its prefixes in the alternation
+    alternation = "|".join(map(re.escape, sorted(names, key=len, reverse=True)))
+    return re.compile(rf"\b({alternation})\b")
+
+
+def _interleave(args: Tuple[Any, ...], separator: str) -> List[Any]:
+    tokens: List[Any] = []
+    for arg in args:
+        tokens.extend((arg, separator))
+    return tokens[:-1]
+
+
+def _infix_tokens(operator: str) -> Callable[[Any], List[Any]]:
+    return lambda sym: ["(", *_interleave(sym.args, operator), ")"]
+
+
+def _function_tokens(name: str) -> Callable[[Any], List[Any]]:
+    return lambda sym: [f"{name}(", *_interleave(sym.args, ","), ")"]
+
+
+def _pow_tokens(sym: Any) -> List[Any]:
+    if sym.args[1] == -1:
+        return ["(1/", sym.args[0], ")"]
+    return ["pow(", *_interleave(sym.args, ","), ")"]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sympy_handlers() -> Tuple[Any, Dict[type, Callable[[Any], List[Any]]]]:
+    sympy_module = cast(Any, utils._auxiliary.local_import("sympy"))
+    handlers = {
+        sympy_module.Add: _infix_tokens("+"),
+        sympy_module.Mul: _infix_tokens("*"),
+        sympy_module.Pow: _pow_tokens,
+        sympy_module.cos: _function_tokens("cos"),
+        sympy_module.sin: _function_tokens("sin"),
+        sympy_module.sqrt: _function_tokens("sqrt"),
+        sympy_module.log: _function_tokens("ln"),
+        sympy_module.exp: _function_tokens("exp"),
+        sympy_module.Abs: _function_tokens("abs"),
+    }
+    return sympy_module, handlers
+
+
 class SyntheticDatapointsAPI(APIClient):
     _RESOURCE_PATH = "/timeseries/synthetic"
+    _SYNTH_FIELDS = ["value", "error"]
+    # Upper bound on concurrent requests, regardless of the client's max_workers, to avoid being throttled:
+    _MAX_WORKERS_SYNTH = 10
 
     def __init__(self, config: ClientConfig, api_version: Optional[str], cognite_client: CogniteClient) -> None:
         super().__init__(config, api_version, cognite_client)
         self._DPS_LIMIT_SYNTH = 10_000
+        self._QUERY_ITEMS_LIMIT_SYNTH = 10
 
     def query(
         self,
@@ -67,52 +126,76 @@ class SyntheticDatapointsAPI(APIClient):
                 >>> dps = c.time_series.data.synthetic.query([sin(a), cos(a)], start="2w-ago", end="now", variables={"a": "my_ts_external_id"}, aggregate='interpolation', granularity='1m')
         """
         if limit is None or limit == -1:
-            limit = cast(int, float("inf"))
+            limit = sys.maxsize
 
-        tasks = []
-        expressions_to_iterate = (
-            expressions if (isinstance(expressions, Sequence) and not isinstance(expressions, str)) else [expressions]
-        )
+        start_ms = cognite.client.utils._time.timestamp_to_ms(start)
+        end_ms = cognite.client.utils._time.timestamp_to_ms(end)
 
-        for i in range(len(expressions_to_iterate)):
-            expression, short_expression = self._build_expression(
-                expressions_to_iterate[i], variables, aggregate, granularity
+        tasks = []
+        is_batch = isinstance(expressions, (list, tuple))
+        expressions_to_iterate = cast(Sequence[Union[str, "sympy.Expr"]], expressions if is_batch else [expressions])
+
+        for expr in expressions_to_iterate:
+            expression, short_expression = self._build_expression(expr, variables, aggregate, granularity)
+            query = {"expression": expression, "start": start_ms, "end": end_ms}
+            tasks.append((query, short_expression, limit))
+
+        # Several expressions are sent in each request, each expression paginating independently:
+        task_batches = [(batch,) for batch in utils._auxiliary.split_into_chunks(tasks, self._QUERY_ITEMS_LIMIT_SYNTH)]
+        max_workers = min(self._config.max_workers, self._MAX_WORKERS_SYNTH)
+        with utils._concurrency.get_priority_executor(max_workers=max_workers) as pool:
+            datapoints_summary = utils._concurrency.execute_tasks(
+                self._fetch_datapoints, task_batches, max_workers=max_workers, executor=pool
             )
-            query = {
-                "expression": expression,
-                "start": cognite.client.utils._time.timestamp_to_ms(start),
-                "end": cognite.client.utils._time.timestamp_to_ms(end),
-            }
-            values: List[float] = []  # mypy
-            query_datapoints = Datapoints(value=values, error=[])
-            query_datapoints.external_id = short_expression
-
-            tasks.append((query, query_datapoints, limit))
-
-        datapoints_summary = utils._concurrency.execute_tasks(
-            self._fetch_datapoints, tasks, max_workers=self._config.max_workers
-        )
 
         if datapoints_summary.exceptions:
             raise datapoints_summary.exceptions[0]
 
-        return (
-            DatapointsList(datapoints_summary.results, cognite_client=self._cognite_client)
-            if isinstance(expressions, List)
-            else datapoints_summary.results[0]
-        )
-
-    def _fetch_datapoints(self, query: Dict[str, Any], datapoints: Datapoints, limit: int) -> Datapoints:
-        while True:
-            query["limit"] = min(limit, self._DPS_LIMIT_SYNTH)
-            resp = self._post(url_path=self._RESOURCE_PATH + "/query", json={"items": [query]})
-            data = resp.json()["items"][0]
-            datapoints._extend(Datapoints._load(data, expected_fields=["value", "error"]))
-            limit -= len(data["datapoints"])
-            if len(data["datapoints"]) < self._DPS_LIMIT_SYNTH or limit <= 0:
-                break
-            query["start"] = data["datapoints"][-1]["timestamp"] + 1
-        return datapoints
+        results = [dps for batch_results in datapoints_summary.results for dps in batch_results]
+        return DatapointsList(results, cognite_client=self._cognite_client) if is_batch else results[0]
+
+    def _fetch_datapoints(self, tasks: List[Tuple[Dict[str, Any], str, int]]) -> List[Datapoints]:
+        queries = [query for query, _, _ in tasks]
+        short_expressions = [short_expression for _, short_expression, _ in tasks]
+        datapoints: List[Optional[Datapoints]] = [None] * len(tasks)
+        limits = [limit for _, _, limit in tasks]
+        active = list(range(len(tasks)))
+        for i in active:
+            queries[i]["limit"] = min(limits[i], self._DPS_LIMIT_SYNTH)
+
+        # Pages are double-buffered: The request for the next page is sent as soon as its cursor is known,
+        # and the current page is parsed while that request is in flight:
+        with utils._concurrency.get_priority_executor(max_workers=1) as pool:
+            future = pool.submit(self._post_query, [queries[i] for i in active])
+            while active:
+                items = future.result()
+                still_active = []
+                for i, data in zip(active, items):
+                    limits[i] -= len(data["datapoints"])
+                    if len(data["datapoints"]) < self._DPS_LIMIT_SYNTH or limits[i] <= 0:
+                        continue
+                    queries[i]["start"] = data["datapoints"][-1]["timestamp"] + 1
+                    queries[i]["limit"] = min(limits[i], self._DPS_LIMIT_SYNTH)
+                    still_active.append(i)
+                if still_active:
+                    future = pool.submit(self._post_query, [queries[i] for i in still_active])
+
+                for i, data in zip(active, items):
+                    page = Datapoints._load(data, expected_fields=self._SYNTH_FIELDS)
+                    if (dps := datapoints[i]) is None:
+                        page.external_id = short_expressions[i]
+                        datapoints[i] = page
+                    else:
+                        dps._extend(page)
+                active = still_active
+        return cast(List[Datapoints], datapoints)
+
+    def _post_query(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        res = self._post(url_path=self._RESOURCE_PATH + "/query", json={"items": items})
+        if ORJSON_IS_AVAILABLE:
+            # Pages of synthetic datapoints are large, and orjson parses them several times faster:
+            return orjson.loads(res.content)["items"]
+        return res.json()["items"]
 
     @staticmethod
     def _build_expression(
@@ -121,6 +204,9 @@ class SyntheticDatapointsAPI(APIClient):
         aggregate: str = None,
         granularity: str = None,
     ) -> Tuple[str, str]:
+        if isinstance(expression, str) and not variables:
+            # Fast path: Nothing to substitute in plain `ts{}`-expressions
+            return expression, expression
         if expression.__class__.__module__.startswith("sympy."):
             expression_str = SyntheticDatapointsAPI._sympy_to_sts(expression)
             if not variables:
@@ -135,46 +221,41 @@ class SyntheticDatapointsAPI(APIClient):
             aggregate_str = ""
         expression_with_ts: str = expression_str
         if variables:
-            for k, v in variables.items():
-                if isinstance(v, TimeSeries):
-                    v = v.external_id
-                expression_with_ts = re.sub(  # type: ignore
-                    re.compile(rf"\b{k}\b"), f"ts{{externalId:'{v}'{aggregate_str}}}", expression_with_ts
-                )
+            replacements = {
+                k: f"ts{{externalId:'{v.external_id if isinstance(v, TimeSeries) else v}'{aggregate_str}}}"
+                for k, v in variables.items()
+            }
+            expression_with_ts = _variables_pattern(tuple(sorted(replacements))).sub(
+                lambda match: replacements[match.group(1)], expression_with_ts
+            )
         return expression_with_ts, expression_str
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _sympy_to_sts(expression: Union[str, sympy.Expr]) -> str:
-        sympy_module = cast(Any, utils._auxiliary.local_import("sympy"))
-
-        infix_ops = {sympy_module.Add: "+", sympy_module.Mul: "*"}
-        functions = {
-            sympy_module.cos: "cos",
-            sympy_module.sin: "sin",
-            sympy_module.sqrt: "sqrt",
-            sympy_module.log: "ln",
-            sympy_module.exp: "exp",
-            sympy_module.Abs: "abs",
-        }
-
-        def process_symbol(sym: Any) -> str:
-            if isinstance(sym, sympy_module.AtomicExpr):
-                if isinstance(sym, sympy_module.NumberSymbol):
-                    return str(sym.evalf(15))
-                else:
-                    return str(sym)
-
-            infixop = infix_ops.get(sym.__class__)
-            if infixop:
-                return "(" + infixop.join(process_symbol(s) for s in sym.args) + ")"
-
-            if isinstance(sym, sympy_module.Pow):
-                if sym.args[1] == -1:
-                    return f"(1/{process_symbol(sym.args[0])})"
-                return f"pow({','.join(map(process_symbol, sym.args))})"
-
-            if funop := functions.get(sym.__class__):
-                return f"{funop}({','.join(map(process_symbol, sym.args))})"
-            raise ValueError(f"Unsupported sympy class {sym.__class__} encountered in expression")
-
-        return process_symbol(expression)
+        sympy_module, handlers = _get_sympy_handlers()
+
+        # Depth-first walk using an explicit stack. Entries are either sympy nodes still to be processed,
+        # or string fragments that are emitted as-is when popped:
+        out: List[str] = []
+        stack: List[Any] = [expression]
+        while stack:
+            sym = stack.pop()
+            if type(sym) is str:
+                out.append(sym)
+                continue
+
+            if (handler := handlers.get(type(sym))) is None:
+                if isinstance(sym, sympy_module.AtomicExpr):
+                    if isinstance(sym, sympy_module.NumberSymbol):
+                        out.append(str(sym.evalf(15)))
+                    else:
+                        out.append(str(sym))
+                    continue
+                # Subclasses of supported classes are rare, so we only walk the MRO on a miss:
+                handler = next((handlers[cls] for cls in type(sym).__mro__ if cls in handlers), None)
+                if handler is None:
+                    raise ValueError(f"Unsupported sympy class {sym.__class__} encountered in expression")
+            stack.extend(reversed(handler(sym)))
+
+        return "".join(out)
@@ -45,7 +45,7 @@ from cognite.client.data_classes._base import (
 from cognite.client.exceptions import CogniteAPIError, CogniteNotFoundError
 from cognite.client.utils._auxiliary import is_unlimited, split_into_chunks
 from cognite.client.utils._identifier import Identifier, IdentifierSequence, SingletonIdentifierSequence
-from cognite.client.utils._text import convert_all_keys_to_camel_case, shorten, to_snake_case
+from cognite.client.utils._text import convert_all_keys_to_camel_case, shorten_str, to_snake_case
 
 if TYPE_CHECKING:
     from cognite.client import CogniteClient
@@ -499,7 +499,7 @@ class APIClient:
             headers=headers,
             initial_cursor=initial_cursor,
         ):
-            items.extend(resource_list.data)
+            items.extend(cast(T_CogniteResourceList, resource_list).data)
         return list_cls(items, cognite_client=self._cognite_client)
 
     def _list_partitioned(
@@ -850,7 +850,7 @@ class APIClient:
             error_details["duplicated"] = duplicated
         error_details["headers"] = res.request.headers.copy()
         cls._sanitize_headers(error_details["headers"])
-        error_details["response_payload"] = shorten(cls._get_response_content_safe(res), 500)
+        error_details["response_payload"] = shorten_str(cls._get_response_content_safe(res), 500)
         error_details["response_headers"] = res.headers
 
         if res.history:
@@ -874,7 +874,7 @@ class APIClient:
 
         stream = kwargs.get("stream")
         if not stream and self._config.debug is True:
-            extra["response_payload"] = shorten(self._get_response_content_safe(res), 500)
+            extra["response_payload"] = shorten_str(self._get_response_content_safe(res), 500)
         extra["response_headers"] = res.headers
 
         try:
@@ -1,33 +1,36 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from requests import Response
 
 from cognite.client import utils
-from cognite.client._api.annotations import AnnotationsAPI
-from cognite.client._api.assets import AssetsAPI
-from cognite.client._api.data_sets import DataSetsAPI
-from cognite.client._api.diagrams import DiagramsAPI
-from cognite.client._api.entity_matching import EntityMatchingAPI
-from cognite.client._api.events import EventsAPI
-from cognite.client._api.extractionpipelines import ExtractionPipelinesAPI
-from cognite.client._api.files import FilesAPI
-from cognite.client._api.functions import FunctionsAPI
-from cognite.client._api.geospatial import GeospatialAPI
-from cognite.client._api.iam import IAMAPI
-from cognite.client._api.labels import LabelsAPI
-from cognite.client._api.raw import RawAPI
-from cognite.client._api.relationships import RelationshipsAPI
-from cognite.client._api.sequences import SequencesAPI
-from cognite.client._api.templates import TemplatesAPI
-from cognite.client._api.three_d import ThreeDAPI
-from cognite.client._api.time_series import TimeSeriesAPI
-from cognite.client._api.transformations import TransformationsAPI
-from cognite.client._api.vision import VisionAPI
 from cognite.client._api_client import APIClient
 from cognite.client.config import ClientConfig, global_config
 
+if TYPE_CHECKING:
+    from cognite.client._api.annotations import AnnotationsAPI
+    from cognite.client._api.assets import AssetsAPI
+    from cognite.client._api.data_sets import DataSetsAPI
+    from cognite.client._api.diagrams import DiagramsAPI
+    from cognite.client._api.entity_matching import EntityMatchingAPI
+    from cognite.client._api.events import EventsAPI
+    from cognite.client._api.extractionpipelines import ExtractionPipelinesAPI
+    from cognite.client._api.files import FilesAPI
+    from cognite.client._api.functions import FunctionsAPI
+    from cognite.client._api.geospatial import GeospatialAPI
+    from cognite.client._api.iam import IAMAPI
+    from cognite.client._api.labels import LabelsAPI
+    from cognite.client._api.raw import RawAPI
+    from cognite.client._api.relationships import RelationshipsAPI
+    from cognite.client._api.sequences import SequencesAPI
+    from cognite.client._api.templates import TemplatesAPI
+    from cognite.client._api.three_d import ThreeDAPI
+    from cognite.client._api.time_series import TimeSeriesAPI
+    from cognite.client._api.transformations import TransformationsAPI
+    from cognite.client._api.vision import VisionAPI
+
 
 class CogniteClient:
     """Main entrypoint into Cognite Python SDK.
@@ -49,31 +52,130 @@ class CogniteClient:
         else:
             self._config = client_config
 
-        # APIs using base_url / resource path:
-        self.assets = AssetsAPI(self._config, self._API_VERSION, self)
-        self.events = EventsAPI(self._config, self._API_VERSION, self)
-        self.files = FilesAPI(self._config, self._API_VERSION, self)
-        self.iam = IAMAPI(self._config, self._API_VERSION, self)
-        self.data_sets = DataSetsAPI(self._config, self._API_VERSION, self)
-        self.sequences = SequencesAPI(self._config, self._API_VERSION, self)
-        self.time_series = TimeSeriesAPI(self._config, self._API_VERSION, self)
-        self.geospatial = GeospatialAPI(self._config, self._API_VERSION, self)
-        self.raw = RawAPI(self._config, self._API_VERSION, self)
-        self.three_d = ThreeDAPI(self._config, self._API_VERSION, self)
-        self.labels = LabelsAPI(self._config, self._API_VERSION, self)
-        self.relationships = RelationshipsAPI(self._config, self._API_VERSION, self)
-        self.entity_matching = EntityMatchingAPI(self._config, self._API_VERSION, self)
-        self.templates = TemplatesAPI(self._config, self._API_VERSION, self)
-        self.vision = VisionAPI(self._config, self._API_VERSION, self)
-        self.extraction_pipelines = ExtractionPipelinesAPI(self._config, self._API_VERSION, self)
-        self.transformations = TransformationsAPI(self._config, self._API_VERSION, self)
-        self.diagrams = DiagramsAPI(self._config, self._API_VERSION, self)
-        self.annotations = AnnotationsAPI(self._config, self._API_VERSION, self)
-        self.functions = FunctionsAPI(self._config, self._API_VERSION, self)
-
         # APIs just using base_url:
         self._api_client = APIClient(self._config, api_version=None, cognite_client=self)
 
+    # APIs using base_url / resource path are imported and instantiated on first access:
+    @cached_property
+    def assets(self) -> AssetsAPI:
+        from cognite.client._api.assets import AssetsAPI
+
+        return AssetsAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def events(self) -> EventsAPI:
+        from cognite.client._api.events import EventsAPI
+
+        return EventsAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def files(self) -> FilesAPI:
+        from cognite.client._api.files import FilesAPI
+
+        return FilesAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def iam(self) -> IAMAPI:
+        from cognite.client._api.iam import IAMAPI
+
+        return IAMAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def data_sets(self) -> DataSetsAPI:
+        from cognite.client._api.data_sets import DataSetsAPI
+
+        return DataSetsAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def sequences(self) -> SequencesAPI:
+        from cognite.client._api.sequences import SequencesAPI
+
+        return SequencesAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def time_series(self) -> TimeSeriesAPI:
+        from cognite.client._api.time_series import TimeSeriesAPI
+
+        return TimeSeriesAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def geospatial(self) -> GeospatialAPI:
+        from cognite.client._api.geospatial import GeospatialAPI
+
+        return GeospatialAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def raw(self) -> RawAPI:
+        from cognite.client._api.raw import RawAPI
+
+        return RawAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def three_d(self) -> ThreeDAPI:
+        from cognite.client._api.three_d import ThreeDAPI
+
+        return ThreeDAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def labels(self) -> LabelsAPI:
+        from cognite.client._api.labels import LabelsAPI
+
+        return LabelsAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def relationships(self) -> RelationshipsAPI:
+        from cognite.client._api.relationships import RelationshipsAPI
+
+        return RelationshipsAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def entity_matching(self) -> EntityMatchingAPI:
+        from cognite.client._api.entity_matching import EntityMatchingAPI
+
+        return EntityMatchingAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def templates(self) -> TemplatesAPI:
+        from cognite.client._api.templates import TemplatesAPI
+
+        return TemplatesAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def vision(self) -> VisionAPI:
+        from cognite.client._api.vision import VisionAPI
+
+        return VisionAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def extraction_pipelines(self) -> ExtractionPipelinesAPI:
+        from cognite.client._api.extractionpipelines import ExtractionPipelinesAPI
+
+        return ExtractionPipelinesAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def transformations(self) -> TransformationsAPI:
+        from cognite.client._api.transformations import TransformationsAPI
+
+        return TransformationsAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def diagrams(self) -> DiagramsAPI:
+        from cognite.client._api.diagrams import DiagramsAPI
+
+        return DiagramsAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def annotations(self) -> AnnotationsAPI:
+        from cognite.client._api.annotations import AnnotationsAPI
+
+        return AnnotationsAPI(self._config, self._API_VERSION, self)
+
+    @cached_property
+    def functions(self) -> FunctionsAPI:
+        from cognite.client._api.functions import FunctionsAPI
+
+        return FunctionsAPI(self._config, self._API_VERSION, self)
+
     def get(self, url: str, params: Dict[str, Any] = None, headers: Dict[str, Any] = None) -> Response:
         """Perform a GET request to an arbitrary path in the API."""
         return self._api_client._get(url, params=params, headers=headers)
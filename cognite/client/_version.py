@@ -1,4 +1,4 @@
 from __future__ import annotations
 
-__version__ = "6.1.0"
+__version__ = "6.2.0"
 __api_subversion__ = "V20220125"
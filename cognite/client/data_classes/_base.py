@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import functools
 import json
 from collections import UserList
-from typing import TYPE_CHECKING, Any, Collection, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from cognite.client import utils
 from cognite.client.exceptions import CogniteMissingClientError
 from cognite.client.utils._identifier import IdentifierSequence
 from cognite.client.utils._pandas_helpers import convert_nullable_int_cols, notebook_display_with_fallback
-from cognite.client.utils._text import convert_all_keys_to_camel_case, to_snake_case
+from cognite.client.utils._text import to_camel_case, to_snake_case
 from cognite.client.utils._time import convert_time_attributes_to_datetime
 
 if TYPE_CHECKING:
@@ -16,15 +31,21 @@ if TYPE_CHECKING:
 
     from cognite.client import CogniteClient
 
-EXCLUDE_VALUE = [None]
+
+@functools.lru_cache(maxsize=1024)
+def _dump_fields(attributes: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    # Keyed on the full attribute layout of an instance (in practice one or two per class), so that
+    # instances with extra or missing attributes never share an entry:
+    return tuple((attr, to_camel_case(attr)) for attr in attributes if not attr.startswith("_"))
 
 
 def basic_instance_dump(obj: Any, camel_case: bool) -> Dict[str, Any]:
     # TODO: Consider using inheritance?
-    dumped = {k: v for k, v in vars(obj).items() if v not in EXCLUDE_VALUE and not k.startswith("_")}
+    attributes = vars(obj)
+    fields = _dump_fields(tuple(attributes))
     if camel_case:
-        return convert_all_keys_to_camel_case(dumped)
-    return dumped
+        return {camel_key: v for key, camel_key in fields if (v := attributes[key]) is not None}
+    return {key: v for key, _ in fields if (v := attributes[key]) is not None}
 
 
 class CogniteResponse:
@@ -67,8 +88,22 @@ class CogniteResponse:
 T_CogniteResponse = TypeVar("T_CogniteResponse", bound=CogniteResponse)
 
 
+class _CogniteClientDescriptor:
+    # The client is stored in the instance dict, like any other attribute, but read through this (data) descriptor.
+    # This way only access to the client pays for the missing-client check, not every attribute lookup:
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if instance is None:
+            return self
+        if (client := instance.__dict__.get("_cognite_client")) is None:
+            raise CogniteMissingClientError
+        return client
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__["_cognite_client"] = value
+
+
 class CogniteResource:
-    _cognite_client: Any
+    _cognite_client: Any = _CogniteClientDescriptor()
 
     def __new__(cls, *args: Any, **kwargs: Any) -> CogniteResource:
         obj = super().__new__(cls)
@@ -84,13 +119,6 @@ class CogniteResource:
         item = convert_time_attributes_to_datetime(self.dump())
         return json.dumps(item, default=utils._auxiliary.json_dump_default, indent=4)
 
-    def __getattribute__(self, item: Any) -> Any:
-        attr = super().__getattribute__(item)
-        if item == "_cognite_client":
-            if attr is None:
-                raise CogniteMissingClientError
-        return attr
-
     def dump(self, camel_case: bool = False) -> Dict[str, Any]:
         """Dump the instance into a json serializable Python data type.
 
@@ -108,7 +136,7 @@ class CogniteResource:
     ) -> T_CogniteResource:
         if isinstance(resource, str):
             return cls._load(json.loads(resource), cognite_client=cognite_client)
-        elif isinstance(resource, Dict):
+        elif isinstance(resource, dict):
             instance = cls(cognite_client=cognite_client)
             for key, value in resource.items():
                 snake_case_key = to_snake_case(key)
@@ -449,7 +477,7 @@ class CogniteFilter:
     def _load(cls: Type[T_CogniteFilter], resource: Union[Dict, str]) -> T_CogniteFilter:
         if isinstance(resource, str):
             return cls._load(json.loads(resource))
-        elif isinstance(resource, Dict):
+        elif isinstance(resource, dict):
             instance = cls()
             for key, value in resource.items():
                 snake_case_key = to_snake_case(key)
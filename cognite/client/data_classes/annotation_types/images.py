@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Optional, Type
 
 from cognite.client.data_classes.annotation_types.primitives import (
     BoundingBox,
@@ -12,6 +12,11 @@ from cognite.client.data_classes.annotation_types.primitives import (
 )
 
 
+def _load_if_dict(value: Any, resource_cls: Type[VisionResource]) -> Any:
+    # Note: isinstance with the builtin 'dict' is much cheaper than with 'typing.Dict'
+    return resource_cls(**value) if isinstance(value, dict) else value
+
+
 @dataclass
 class ObjectDetection(VisionResource):
     label: str
@@ -22,12 +27,9 @@ class ObjectDetection(VisionResource):
     polyline: Optional[PolyLine] = None
 
     def __post_init__(self) -> None:
-        if isinstance(self.bounding_box, Dict):
-            self.bounding_box = BoundingBox(**self.bounding_box)
-        if isinstance(self.polygon, Dict):
-            self.polygon = Polygon(**self.polygon)
-        if isinstance(self.polyline, Dict):
-            self.polyline = PolyLine(**self.polyline)
+        self.bounding_box = _load_if_dict(self.bounding_box, BoundingBox)
+        self.polygon = _load_if_dict(self.polygon, Polygon)
+        self.polyline = _load_if_dict(self.polyline, PolyLine)
 
 
 @dataclass
@@ -37,8 +39,7 @@ class TextRegion(VisionResource):
     confidence: Optional[float] = None
 
     def __post_init__(self) -> None:
-        if isinstance(self.text_region, Dict):
-            self.text_region = BoundingBox(**self.text_region)
+        self.text_region = _load_if_dict(self.text_region, BoundingBox)
 
 
 @dataclass
@@ -49,7 +50,5 @@ class AssetLink(VisionResource):
     confidence: Optional[float] = None
 
     def __post_init__(self) -> None:
-        if isinstance(self.text_region, Dict):
-            self.text_region = BoundingBox(**self.text_region)
-        if isinstance(self.asset_ref, Dict):
-            self.asset_ref = CdfResourceRef(**self.asset_ref)
+        self.text_region = _load_if_dict(self.text_region, BoundingBox)
+        self.asset_ref = _load_if_dict(self.asset_ref, CdfResourceRef)
@@ -154,7 +154,7 @@ class Asset(CogniteResource):
     @classmethod
     def _load(cls, resource: Union[Dict, str], cognite_client: CogniteClient = None) -> Asset:
         instance = super()._load(resource, cognite_client)
-        if isinstance(resource, Dict):
+        if isinstance(resource, dict):
             if instance.aggregates is not None:
                 instance.aggregates = AggregateResultItem(**instance.aggregates)
         instance.labels = Label._load_list(instance.labels)
@@ -455,7 +455,7 @@ class AssetFilter(CogniteFilter):
     @classmethod
     def _load(cls, resource: Union[Dict, str]) -> AssetFilter:
         instance = super()._load(resource)
-        if isinstance(resource, Dict):
+        if isinstance(resource, dict):
             if instance.created_time is not None:
                 instance.created_time = TimestampRange(**instance.created_time)
             if instance.last_updated_time is not None:
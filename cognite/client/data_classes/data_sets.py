@@ -88,7 +88,7 @@ class DataSetFilter(CogniteFilter):
     @classmethod
     def _load(cls, resource: Union[Dict, str]) -> DataSetFilter:
         instance = super()._load(resource)
-        if isinstance(resource, Dict):
+        if isinstance(resource, dict):
             if instance.created_time is not None:
                 instance.created_time = TimestampRange(**instance.created_time)
             if instance.last_updated_time is not None:
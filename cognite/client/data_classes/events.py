@@ -150,7 +150,7 @@ class EventFilter(CogniteFilter):
     @classmethod
     def _load(cls, resource: Union[Dict, str]) -> EventFilter:
         instance = super()._load(resource)
-        if isinstance(resource, Dict):
+        if isinstance(resource, dict):
             if instance.start_time is not None:
                 instance.start_time = TimestampRange(**instance.start_time)
             if instance.end_time is not None:
@@ -291,7 +291,7 @@ class ExtractionPipelineRunFilter(CogniteFilter):
     @classmethod
     def _load(cls, resource: Union[Dict, str]) -> ExtractionPipelineRunFilter:
         instance = super()._load(resource)
-        if isinstance(resource, Dict):
+        if isinstance(resource, dict):
             if instance.created_time is not None:
                 instance.created_time = TimestampRange(**instance.created_time)
         return instance
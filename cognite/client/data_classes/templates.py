@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+import functools
 import json
-from collections import UserDict
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union, cast
 
 from cognite.client.data_classes._base import (
-    EXCLUDE_VALUE,
     CogniteObjectUpdate,
     CogniteResource,
     CogniteResourceList,
     CogniteUpdate,
+    _dump_fields,
+    basic_instance_dump,
 )
-from cognite.client.utils._text import to_camel_case, to_snake_case
 
 if TYPE_CHECKING:
     from cognite.client import CogniteClient
 
 
+@functools.lru_cache(maxsize=64)
+def _load_fields(attributes: Tuple[str, ...]) -> Dict[str, str]:
+    # Maps both the attribute names and their camelCase names (as used by the API) to the attribute names.
+    # Like the dump fields, this is derived from (and keyed on) the attributes that __init__ sets:
+    return {name: attr for attr, camel_attr in _dump_fields(attributes) for name in (attr, camel_attr)}
+
+
 class TemplateGroup(CogniteResource):
     """A template group is a high level concept encapsulating a schema and a set of template instances. It also has query capability support.
 
@@ -231,21 +238,11 @@ class TemplateInstance(CogniteResource):
         Returns:
             Dict[str, Any]: A dictionary representation of the instance.
         """
-        if camel_case:
-            return {
-                to_camel_case(key): value
-                if key != "field_resolvers"
-                else TemplateInstance._encode_field_resolvers(value, camel_case=camel_case)
-                for key, value in self.__dict__.items()
-                if value not in EXCLUDE_VALUE and not key.startswith("_")
-            }
-        return {
-            key: value
-            if key != "field_resolvers"
-            else TemplateInstance._encode_field_resolvers(value, camel_case=camel_case)
-            for key, value in self.__dict__.items()
-            if value not in EXCLUDE_VALUE and not key.startswith("_")
-        }
+        dumped = basic_instance_dump(self, camel_case=camel_case)
+        key = "fieldResolvers" if camel_case else "field_resolvers"
+        if key in dumped:
+            dumped[key] = TemplateInstance._encode_field_resolvers(dumped[key], camel_case=camel_case)
+        return dumped
 
     @staticmethod
     def _encode_field_resolvers(field_resolvers: Dict[str, FieldResolvers], camel_case: bool) -> Dict[str, Any]:
@@ -256,26 +253,27 @@ class TemplateInstance(CogniteResource):
 
     @classmethod
     def _load(cls, resource: Union[Dict, str], cognite_client: CogniteClient = None) -> TemplateInstance:
-        if isinstance(resource, str):
-            return cls._load(json.loads(resource), cognite_client=cognite_client)
-        elif isinstance(resource, Dict):
-            instance = cls(cognite_client=cognite_client)
-            for key, value in resource.items():
-                snake_case_key = to_snake_case(key)
-                if hasattr(instance, snake_case_key):
-                    if key == "fieldResolvers":
-                        setattr(
-                            instance,
-                            snake_case_key,
-                            {
-                                key: TemplateInstance._field_resolver_load(field_resolver)
-                                for key, field_resolver in value.items()
-                            },
-                        )
-                    else:
-                        setattr(instance, snake_case_key, value)
-            return instance
-        raise TypeError(f"Resource must be json str or dict, not {type(resource)}")
+        loaded = json.loads(resource) if isinstance(resource, str) else resource
+        if isinstance(loaded, dict):
+            return cls._load_from_dict(loaded, cognite_client)
+        raise TypeError(f"Resource must be json str or dict, not {type(loaded)}")
+
+    @classmethod
+    def _load_from_dict(cls, resource: Dict[str, Any], cognite_client: Optional[CogniteClient]) -> TemplateInstance:
+        instance = cls(cognite_client=cognite_client)
+        attributes = vars(instance)
+        load_fields = _load_fields(tuple(attributes))
+        for key, value in resource.items():
+            attr = load_fields.get(key)
+            if attr is None:
+                continue
+            if attr == "field_resolvers":
+                value = {
+                    name: TemplateInstance._field_resolver_load(field_resolver)
+                    for name, field_resolver in value.items()
+                }
+            attributes[attr] = value
+        return instance
 
     @staticmethod
     def _field_resolver_load(resource: Dict, cognite_client: CogniteClient = None) -> CogniteResource:
@@ -362,17 +360,10 @@ class View(CogniteResource):
         Returns:
             Dict[str, Any]: A dictionary representation of the instance.
         """
-        if camel_case:
-            return {
-                to_camel_case(key): View.resolve_nested_classes(value, camel_case)
-                for key, value in self.__dict__.items()
-                if value not in EXCLUDE_VALUE and not key.startswith("_")
-            }
-        return {
-            key: View.resolve_nested_classes(value, camel_case)
-            for key, value in self.__dict__.items()
-            if value not in EXCLUDE_VALUE and not key.startswith("_")
-        }
+        dumped = basic_instance_dump(self, camel_case=camel_case)
+        if "source" in dumped:
+            dumped["source"] = View.resolve_nested_classes(dumped["source"], camel_case)
+        return dumped
 
     @staticmethod
     def resolve_nested_classes(value: Union[CogniteResource, Dict], camel_case: bool) -> Dict:
@@ -383,32 +374,37 @@ class View(CogniteResource):
 
     @classmethod
     def _load(cls, resource: Union[Dict, str], cognite_client: CogniteClient = None) -> View:
-        if isinstance(resource, str):
-            return cls._load(json.loads(resource), cognite_client=cognite_client)
-        elif isinstance(resource, Dict):
-            instance = cls(cognite_client=cognite_client)
-            for key, value in resource.items():
-                snake_case_key = to_snake_case(key)
-                if hasattr(instance, snake_case_key):
-                    value = value if key != "source" else Source._load(value, cognite_client)
-                    setattr(instance, snake_case_key, value)
-            return instance
-        raise TypeError(f"Resource must be json str or dict, not {type(resource)}")
-
-
-class ViewResolveItem(UserDict, CogniteResource):
+        loaded = json.loads(resource) if isinstance(resource, str) else resource
+        if isinstance(loaded, dict):
+            return cls._load_from_dict(loaded, cognite_client)
+        raise TypeError(f"Resource must be json str or dict, not {type(loaded)}")
+
+    @classmethod
+    def _load_from_dict(cls, resource: Dict[str, Any], cognite_client: Optional[CogniteClient]) -> View:
+        instance = cls(cognite_client=cognite_client)
+        attributes = vars(instance)
+        load_fields = _load_fields(tuple(attributes))
+        for key, value in resource.items():
+            attr = load_fields.get(key)
+            if attr is None:
+                continue
+            attributes[attr] = value if attr != "source" else Source._load(value, cognite_client)
+        return instance
+
+
+class ViewResolveItem(dict, CogniteResource):
     def __init__(self, data: Dict[str, Any], cognite_client: CogniteClient = None) -> None:
         super().__init__(data)
         self._cognite_client = cast("CogniteClient", cognite_client)
 
     def dump(self, camel_case: bool = False) -> Dict[str, Any]:
-        return self.data
+        return dict(self)
 
     @classmethod
     def _load(cls, data: Union[Dict, str], cognite_client: CogniteClient = None) -> ViewResolveItem:
         if isinstance(data, str):
             return cls._load(json.loads(data), cognite_client=cognite_client)
-        elif isinstance(data, Dict):
+        elif isinstance(data, dict):
             return cls(data, cognite_client=cognite_client)
 
 
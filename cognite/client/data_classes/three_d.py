@@ -177,7 +177,7 @@ class ThreeDModelRevision(CogniteResource):
     @classmethod
     def _load(cls, resource: Union[Dict, str], cognite_client: CogniteClient = None) -> ThreeDModelRevision:
         instance = super()._load(resource, cognite_client)
-        if isinstance(resource, Dict):
+        if isinstance(resource, dict):
             if instance.camera is not None:
                 instance.camera = RevisionCameraProperties(**instance.camera)
         return instance
@@ -282,7 +282,7 @@ class ThreeDNode(CogniteResource):
     @classmethod
     def _load(cls, resource: Union[Dict, str], cognite_client: CogniteClient = None) -> ThreeDNode:
         instance = super()._load(resource, cognite_client)
-        if isinstance(resource, Dict):
+        if isinstance(resource, dict):
             if instance.bounding_box is not None:
                 instance.bounding_box = BoundingBox3D(**instance.bounding_box)
         return instance
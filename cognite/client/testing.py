@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Any, Iterator
+from typing import Any, Dict, Iterator
 from unittest.mock import MagicMock
 
 from cognite.client import CogniteClient
@@ -50,93 +50,119 @@ from cognite.client._api.transformations import (
 )
 from cognite.client._api.vision import VisionAPI
 
+# Attribute name -> spec. APIs with nested APIs are given as (spec, {nested attribute name -> spec}).
+# Developer note:
+# - Please add your mocked APIs in chronological order
+# - APIs with nested APIs are mocked with `spec`, all others with `spec_set`
+_API_SPECS: Dict[str, Any] = {
+    "annotations": AnnotationsAPI,
+    "assets": AssetsAPI,
+    "data_sets": DataSetsAPI,
+    "diagrams": DiagramsAPI,
+    "entity_matching": EntityMatchingAPI,
+    "events": EventsAPI,
+    "extraction_pipelines": (
+        ExtractionPipelinesAPI,
+        {"config": ExtractionPipelineConfigsAPI, "runs": ExtractionPipelineRunsAPI},
+    ),
+    "files": FilesAPI,
+    "functions": (FunctionsAPI, {"calls": FunctionCallsAPI, "schedules": FunctionSchedulesAPI}),
+    "geospatial": GeospatialAPI,
+    "iam": (
+        IAMAPI,
+        {
+            "groups": GroupsAPI,
+            "security_categories": SecurityCategoriesAPI,
+            "sessions": SessionsAPI,
+            "token": TokenAPI,
+        },
+    ),
+    "labels": LabelsAPI,
+    "raw": (RawAPI, {"databases": RawDatabasesAPI, "rows": RawRowsAPI, "tables": RawTablesAPI}),
+    "relationships": RelationshipsAPI,
+    "sequences": (SequencesAPI, {"data": SequencesDataAPI}),
+    "templates": (
+        TemplatesAPI,
+        {
+            "groups": TemplateGroupsAPI,
+            "instances": TemplateInstancesAPI,
+            "versions": TemplateGroupVersionsAPI,
+            "views": TemplateViewsAPI,
+        },
+    ),
+    "three_d": (
+        ThreeDAPI,
+        {
+            "asset_mappings": ThreeDAssetMappingAPI,
+            "files": ThreeDFilesAPI,
+            "models": ThreeDModelsAPI,
+            "revisions": ThreeDRevisionsAPI,
+        },
+    ),
+    "time_series": (TimeSeriesAPI, {"data": (DatapointsAPI, {"synthetic": SyntheticDatapointsAPI})}),
+    "transformations": (
+        TransformationsAPI,
+        {
+            "jobs": TransformationJobsAPI,
+            "notifications": TransformationNotificationsAPI,
+            "schedules": TransformationSchedulesAPI,
+            "schema": TransformationSchemaAPI,
+        },
+    ),
+    "vision": VisionAPI,
+}
+
+
+def _create_api_mock(spec: Any, **kwargs: Any) -> MagicMock:
+    if not isinstance(spec, tuple):
+        return MagicMock(spec_set=spec, **kwargs)
+    api_spec, nested_specs = spec
+    api_mock = MagicMock(spec=api_spec, **kwargs)
+    for name, nested_spec in nested_specs.items():
+        setattr(api_mock, name, _create_api_mock(nested_spec))
+    return api_mock
+
 
 class CogniteClientMock(MagicMock):
     """Mock for CogniteClient object
 
     All APIs are replaced with specced MagicMock objects.
+
+    Args:
+        strict_spec (bool): Mock every API with its spec, so that using non-existing methods or attributes raises.
+            Pass False to only spec the client itself. Defaults to True.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(self, *args: Any, strict_spec: bool = True, **kwargs: Any) -> None:
         if "parent" in kwargs:
             super().__init__(*args, **kwargs)
+            self._strict_spec = False
             return None
         super().__init__(spec=CogniteClient, *args, **kwargs)
-        # Developer note:
-        # - Please add your mocked APIs in chronological order
-        # - For nested APIs:
-        #   - Add spacing above and below
-        #   - Use `spec=MyAPI` only for "top level"
-        #   - Use `spec_set=MyNestedAPI` for all nested APIs
-        self.annotations = MagicMock(spec_set=AnnotationsAPI)
-        self.assets = MagicMock(spec_set=AssetsAPI)
-        self.data_sets = MagicMock(spec_set=DataSetsAPI)
-
-        self.diagrams = MagicMock(spec_set=DiagramsAPI)
-        self.entity_matching = MagicMock(spec_set=EntityMatchingAPI)
-        self.events = MagicMock(spec_set=EventsAPI)
-
-        self.extraction_pipelines = MagicMock(spec=ExtractionPipelinesAPI)
-        self.extraction_pipelines.config = MagicMock(spec_set=ExtractionPipelineConfigsAPI)
-        self.extraction_pipelines.runs = MagicMock(spec_set=ExtractionPipelineRunsAPI)
-
-        self.files = MagicMock(spec_set=FilesAPI)
-
-        self.functions = MagicMock(spec=FunctionsAPI)
-        self.functions.calls = MagicMock(spec_set=FunctionCallsAPI)
-        self.functions.schedules = MagicMock(spec_set=FunctionSchedulesAPI)
-
-        self.geospatial = MagicMock(spec_set=GeospatialAPI)
-
-        self.iam = MagicMock(spec=IAMAPI)
-        self.iam.groups = MagicMock(spec_set=GroupsAPI)
-        self.iam.security_categories = MagicMock(spec_set=SecurityCategoriesAPI)
-        self.iam.sessions = MagicMock(spec_set=SessionsAPI)
-        self.iam.token = MagicMock(spec_set=TokenAPI)
-
-        self.labels = MagicMock(spec_set=LabelsAPI)
+        self._strict_spec = strict_spec
 
-        self.raw = MagicMock(spec=RawAPI)
-        self.raw.databases = MagicMock(spec_set=RawDatabasesAPI)
-        self.raw.rows = MagicMock(spec_set=RawRowsAPI)
-        self.raw.tables = MagicMock(spec_set=RawTablesAPI)
-
-        self.relationships = MagicMock(spec_set=RelationshipsAPI)
-
-        self.sequences = MagicMock(spec=SequencesAPI)
-        self.sequences.data = MagicMock(spec_set=SequencesDataAPI)
-
-        self.templates = MagicMock(spec=TemplatesAPI)
-        self.templates.groups = MagicMock(spec_set=TemplateGroupsAPI)
-        self.templates.instances = MagicMock(spec_set=TemplateInstancesAPI)
-        self.templates.versions = MagicMock(spec_set=TemplateGroupVersionsAPI)
-        self.templates.views = MagicMock(spec_set=TemplateViewsAPI)
-
-        self.three_d = MagicMock(spec=ThreeDAPI)
-        self.three_d.asset_mappings = MagicMock(spec_set=ThreeDAssetMappingAPI)
-        self.three_d.files = MagicMock(spec_set=ThreeDFilesAPI)
-        self.three_d.models = MagicMock(spec_set=ThreeDModelsAPI)
-        self.three_d.revisions = MagicMock(spec_set=ThreeDRevisionsAPI)
-
-        self.time_series = MagicMock(spec=TimeSeriesAPI)
-        self.time_series.data = MagicMock(spec=DatapointsAPI)
-        self.time_series.data.synthetic = MagicMock(spec_set=SyntheticDatapointsAPI)
-
-        self.transformations = MagicMock(spec=TransformationsAPI)
-        self.transformations.jobs = MagicMock(spec_set=TransformationJobsAPI)
-        self.transformations.notifications = MagicMock(spec_set=TransformationNotificationsAPI)
-        self.transformations.schedules = MagicMock(spec_set=TransformationSchedulesAPI)
-        self.transformations.schema = MagicMock(spec_set=TransformationSchemaAPI)
-
-        self.vision = MagicMock(spec_set=VisionAPI)
+    def __getattr__(self, name: str) -> Any:
+        # Specced mocks are expensive to create, so each API is mocked on first access only:
+        if name not in _API_SPECS or not self._strict_spec or name in self._mock_children:
+            return super().__getattr__(name)
+        # We register the API mock as a child the same way MagicMock does for its own children. Going through
+        # __setattr__ instead would recurse back into __getattr__ on a sealed mock:
+        api_mock = _create_api_mock(_API_SPECS[name], parent=self, name=name, _new_parent=self, _new_name=name)
+        self._mock_children[name] = api_mock
+        return api_mock
 
 
 @contextmanager
-def monkeypatch_cognite_client() -> Iterator[CogniteClientMock]:
+def monkeypatch_cognite_client(strict_spec: bool = True) -> Iterator[CogniteClientMock]:
     """Context manager for monkeypatching the CogniteClient.
 
     Will patch all clients and replace them with specced MagicMock objects.
 
+    Args:
+        strict_spec (bool): Mock every API with its spec, so that using non-existing methods or attributes raises.
+            Pass False to only spec the client itself, which is cheaper for tests that mock many APIs but do not
+            need this validation. Defaults to True.
+
     Yields:
         CogniteClientMock: The mock with which the CogniteClient has been replaced
 
@@ -181,7 +207,7 @@ def monkeypatch_cognite_client() -> Iterator[CogniteClientMock]:
             >>>         assert 400 == e.code
             >>>         assert "Something went wrong" == e.message
     """
-    cognite_client_mock = CogniteClientMock()
+    cognite_client_mock = CogniteClientMock(strict_spec=strict_spec)
     CogniteClient.__new__ = lambda *args, **kwargs: cognite_client_mock  # type: ignore[assignment]
     yield cognite_client_mock
     CogniteClient.__new__ = lambda cls, *args, **kwargs: object.__new__(cls)  # type: ignore[assignment]
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 import functools
-import inspect
 from collections import UserList
 from concurrent.futures import CancelledError, ThreadPoolExecutor
-from copy import copy
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -23,7 +21,7 @@ from typing import (
 )
 
 from cognite.client.exceptions import CogniteAPIError, CogniteDuplicatedError, CogniteNotFoundError
-from cognite.client.utils._priority_tpe import PriorityThreadPoolExecutor
+from cognite.client.utils._priority_tpe import PriorityThreadPoolExecutor, accepts_priority
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -169,7 +167,7 @@ class MainThreadExecutor(TaskExecutor):
     """
 
     def submit(self, fn: Callable[..., T_Result], *args: Any, **kwargs: Any) -> SyncFuture:
-        if "priority" in inspect.signature(fn).parameters:
+        if accepts_priority(fn):
             raise TypeError(f"Given function {fn} cannot accept reserved parameter name `priority`")
         kwargs.pop("priority", None)
         return SyncFuture(fn, *args, **kwargs)
@@ -179,7 +177,12 @@ class MainThreadExecutor(TaskExecutor):
 
     @staticmethod
     def as_completed(it: Iterable[SyncFuture]) -> Iterator[SyncFuture]:
-        return iter(copy(it))
+        # Callers remove futures from `it` while iterating, so we must iterate a snapshot. Most callers only
+        # ask for the next future however, so the snapshot is deferred until a second future is requested:
+        if (first := next(iter(it), None)) is None:
+            return
+        yield first
+        yield from [fut for fut in it if fut is not first]
 
     def __enter__(self) -> MainThreadExecutor:
         return self
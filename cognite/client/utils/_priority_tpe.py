@@ -30,6 +30,7 @@ SOFTWARE.
 """
 from __future__ import annotations
 
+import functools
 import inspect
 import itertools
 import sys
@@ -38,7 +39,8 @@ from concurrent.futures import Future, as_completed
 from concurrent.futures.thread import ThreadPoolExecutor, _base, _WorkItem
 from queue import Empty, PriorityQueue
 from threading import Lock, Thread
-from typing import Iterable, Iterator
+from types import CodeType, FunctionType
+from typing import Any, Callable, Iterable, Iterator
 
 NULL_ENTRY = (-1, None, None)
 _THREADS_QUEUES = weakref.WeakKeyDictionary()
@@ -70,6 +72,21 @@ else:
 _register_atexit(python_exit)
 
 
+@functools.lru_cache(maxsize=256)
+def _code_has_priority_parameter(code: CodeType) -> bool:
+    return "priority" in code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+
+
+def accepts_priority(fn: Callable[..., Any]) -> bool:
+    # Bound methods and closures are created anew all the time, so we cache on the underlying code object. This
+    # also avoids keeping whatever state a closure captures alive. Wrapped functions (and other callables) might
+    # not share signature with their code object, so we inspect those:
+    fn = getattr(fn, "__func__", fn)
+    if isinstance(fn, FunctionType) and not hasattr(fn, "__wrapped__"):
+        return _code_has_priority_parameter(fn.__code__)
+    return "priority" in inspect.signature(fn).parameters
+
+
 def _worker(executor_reference, work_queue):
     try:
         while True:
@@ -107,7 +124,7 @@ class PriorityThreadPoolExecutor(ThreadPoolExecutor):
         return as_completed(futures)
 
     def submit(self, fn, *args, **kwargs):
-        if "priority" in inspect.signature(fn).parameters:
+        if accepts_priority(fn):
             raise TypeError(f"Given function {fn} cannot accept reserved parameter name `priority`")
 
         with self._shutdown_lock, _GLOBAL_SHUTDOWN_LOCK:
@@ -1,5 +1,4 @@
 import random
-import re
 import string
 from functools import lru_cache
 from typing import Any, Dict, Iterator, Sequence
@@ -16,16 +15,30 @@ def random_string(size: int = 100, sample_from: str = string.ascii_uppercase + s
     return "".join(random.choices(sample_from, k=size))
 
 
-@lru_cache(maxsize=128)
+# Both caches are bounded because user-defined names (e.g. geospatial properties) are also converted:
+@lru_cache(maxsize=4096)
 def to_camel_case(snake_case_string: str) -> str:
     components = snake_case_string.split("_")
     return components[0] + "".join(x.title() for x in components[1:])
 
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=4096)
 def to_snake_case(camel_case_string: str) -> str:
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", camel_case_string)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    # Single pass equivalent of the regex substitutions "(.)([A-Z][a-z]+)" followed by "([a-z0-9])([A-Z])":
+    # An underscore is inserted before an (ASCII) uppercase letter, unless it is the first character, if it
+    # follows a lowercase letter or digit, or if it starts a new word (i.e. is followed by a lowercase letter).
+    out = []
+    prev, last_idx = "", len(camel_case_string) - 1
+    for i, c in enumerate(camel_case_string):
+        if (
+            "A" <= c <= "Z"
+            and i > 0
+            and ("a" <= prev <= "z" or "0" <= prev <= "9" or (i < last_idx and "a" <= camel_case_string[i + 1] <= "z"))
+        ):
+            out.append("_")
+        out.append(c)
+        prev = c
+    return "".join(out).lower()
 
 
 def iterable_to_case(seq: Sequence[str], camel_case: bool) -> Iterator[str]:
@@ -36,11 +49,11 @@ def iterable_to_case(seq: Sequence[str], camel_case: bool) -> Iterator[str]:
 
 
 def convert_all_keys_to_camel_case(dct: Dict[str, Any]) -> Dict[str, Any]:
-    return dict(zip(map(to_camel_case, dct.keys()), dct.values()))
+    return {to_camel_case(key): value for key, value in dct.items()}
 
 
 def convert_all_keys_to_snake_case(dct: Dict[str, Any]) -> Dict[str, Any]:
-    return dict(zip(map(to_snake_case, dct.keys()), dct.values()))
+    return {to_snake_case(key): value for key, value in dct.items()}
 
 
 def convert_dict_to_case(dct: Dict[str, Any], camel_case: bool) -> Dict[str, Any]:
@@ -51,10 +64,13 @@ def convert_dict_to_case(dct: Dict[str, Any], camel_case: bool) -> Dict[str, Any
 
 def shorten(obj: Any, width: int = 20, placeholder: str = "...") -> str:
     # 'textwrap.shorten' skips entire words... so we make our own:
-    if width < (n := len(placeholder)):
+    if width < len(placeholder):
         raise ValueError("Width must be larger than or equal to the length of 'placeholder'")
+    return shorten_str(obj if isinstance(obj, str) else repr(obj), width, placeholder)
 
-    s = obj if isinstance(obj, str) else repr(obj)
+
+def shorten_str(s: str, width: int = 20, placeholder: str = "...") -> str:
+    # Fast path of 'shorten' for strings, without validation of 'width' against 'placeholder':
     if len(s) <= width:
         return s
-    return f"{s[:width-n]}{placeholder}"
+    return f"{s[:width - len(placeholder)]}{placeholder}"
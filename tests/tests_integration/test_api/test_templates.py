@@ -13,24 +13,27 @@ from cognite.client.data_classes import (
 )
 from cognite.client.data_classes.events import Event
 from cognite.client.data_classes.templates import Source, TemplateInstanceUpdate, View, ViewResolver
-from cognite.client.exceptions import CogniteNotFoundError
+from cognite.client.exceptions import CogniteDuplicatedError, CogniteNotFoundError
 
 
-@pytest.fixture
-def new_template_group(cognite_client):
+@pytest.fixture(scope="session")
+def current_user(cognite_client):
+    return cognite_client.iam.token.inspect().subject
+
+
+@pytest.fixture(scope="module")
+def new_template_group(cognite_client, current_user):
     external_id = uuid.uuid4().hex[:20]
-    username = cognite_client.iam.token.inspect().subject
     template_group = cognite_client.templates.groups.create(
         TemplateGroup(
-            external_id=external_id, description="some description", owners=[username, external_id + "@cognite.com"]
+            external_id=external_id, description="some description", owners=[current_user, external_id + "@cognite.com"]
         )
     )
     yield template_group, external_id
     cognite_client.templates.groups.delete(external_ids=external_id)
-    assert cognite_client.templates.groups.retrieve_multiple(external_ids=template_group.external_id) is None
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def new_template_group_version(cognite_client, new_template_group):
     new_group, ext_id = new_template_group
     schema = """
@@ -68,22 +71,29 @@ def new_template_instance(cognite_client, new_template_group_version):
             "confirmed": ConstantResolver("Norway_confirmed"),
         },
     )
-    instance = cognite_client.templates.instances.create(ext_id, new_version.version, template_instance_1)
+    version = new_version.version
+    instance = cognite_client.templates.instances.create(ext_id, version, template_instance_1)
     yield new_group, ext_id, new_version, instance
-    cognite_client.templates.instances.delete(ext_id, new_version.version, instance.external_id)
+    cognite_client.templates.instances.delete(ext_id, version, instance.external_id)
 
 
-@pytest.fixture
-def new_view(cognite_client, new_template_group_version):
-    events = []
-    for i in range(0, 1001):
-        events.append(Event(external_id="test_evt_templates_1_" + str(i), type="test_templates_1", start_time=i * 1000))
+@pytest.fixture(scope="session")
+def template_events(cognite_client):
+    # We only generate this data once for a given project, to prevent issues with eventual consistency etc.
+    if cognite_client.events.retrieve_multiple(external_ids=["test_evt_templates_1_0"], ignore_unknown_ids=True):
+        return
+    events = [
+        Event(external_id="test_evt_templates_1_" + str(i), type="test_templates_1", start_time=i * 1000)
+        for i in range(0, 1001)
+    ]
     try:
         cognite_client.events.create(events)
-    except Exception:
-        # We only generate this data once for a given project, to prevent issues with eventual consistency etc.
-        None
+    except CogniteDuplicatedError:
+        pass  # Created by a concurrent test run
 
+
+@pytest.fixture
+def new_view(cognite_client, template_events, new_template_group_version):
     new_group, ext_id, new_version = new_template_group_version
     view = View(
         external_id="test",
@@ -93,10 +103,11 @@ def new_view(cognite_client, new_template_group_version):
             mappings={"test_type": "type", "startTime": "startTime"},
         ),
     )
-    view = cognite_client.templates.views.create(ext_id, new_version.version, view)
+    version = new_version.version
+    view = cognite_client.templates.views.create(ext_id, version, view)
     yield new_group, ext_id, new_version, view
     try:
-        cognite_client.templates.views.delete(ext_id, new_version.version, view.external_id)
+        cognite_client.templates.views.delete(ext_id, version, view.external_id)
     except Exception:
         None
 
@@ -121,9 +132,18 @@ class TestTemplatesCogniteClient:
 
     def test_groups_upsert(self, cognite_client, new_template_group):
         new_group, ext_id = new_template_group
-        res = cognite_client.templates.groups.upsert(TemplateGroup(ext_id))
+        # The group is shared by the whole module, so we keep its owners and description:
+        res = cognite_client.templates.groups.upsert(
+            TemplateGroup(ext_id, description=new_group.description, owners=new_group.owners)
+        )
         assert isinstance(res, TemplateGroup)
 
+    def test_groups_delete(self, cognite_client, current_user):
+        external_id = uuid.uuid4().hex[:20]
+        cognite_client.templates.groups.create(TemplateGroup(external_id=external_id, owners=[current_user]))
+        cognite_client.templates.groups.delete(external_ids=external_id)
+        assert cognite_client.templates.groups.retrieve_multiple(external_ids=external_id) is None
+
     def test_versions_list(self, cognite_client, new_template_group_version):
         new_group, ext_id, new_version = new_template_group_version
         res = cognite_client.templates.versions.list(ext_id)
@@ -207,40 +227,27 @@ class TestTemplatesCogniteClient:
 
     def test_view_list(self, cognite_client, new_view):
         new_group, ext_id, new_version, view = new_view
-        first_element = [
-            res
-            for res in cognite_client.templates.views.list(ext_id, new_version.version)
-            if res.external_id == view.external_id
-        ][0]
-        assert first_element == view
+        views = cognite_client.templates.views.list(ext_id, new_version.version)
+        assert views.get(external_id=view.external_id) == view
 
     def test_view_delete(self, cognite_client, new_view):
         new_group, ext_id, new_version, view = new_view
-        cognite_client.templates.views.delete(ext_id, new_version.version, [view.external_id])
-        assert (
-            len(
-                [
-                    res
-                    for res in cognite_client.templates.views.list(ext_id, new_version.version)
-                    if res.external_id == view.external_id
-                ]
-            )
-            == 0
-        )
-
-    def test_view_resolve(self, cognite_client, new_view):
-        new_group, ext_id, new_version, view = new_view
-        res = cognite_client.templates.views.resolve(
-            ext_id, new_version.version, view.external_id, input={"minStartTime": 10 * 1000}, limit=10
-        )
-        assert res == [{"startTime": (i + 10) * 1000, "test_type": "test_templates_1"} for i in range(0, 10)]
+        version = new_version.version
+        cognite_client.templates.views.delete(ext_id, version, [view.external_id])
+        views = cognite_client.templates.views.list(ext_id, version)
+        assert views.get(external_id=view.external_id) is None
 
-    def test_view_resolve_pagination(self, cognite_client, new_view):
+    @pytest.mark.parametrize(
+        "min_start_time, limit, expected_range",
+        [(10 * 1000, 10, range(10, 20)), (0, -1, range(0, 1001))],
+        ids=["limited", "paginated"],
+    )
+    def test_view_resolve(self, cognite_client, new_view, min_start_time, limit, expected_range):
         new_group, ext_id, new_version, view = new_view
         res = cognite_client.templates.views.resolve(
-            ext_id, new_version.version, view.external_id, input={"minStartTime": 0}, limit=-1
+            ext_id, new_version.version, view.external_id, input={"minStartTime": min_start_time}, limit=limit
         )
-        assert res == [{"startTime": i * 1000, "test_type": "test_templates_1"} for i in range(0, 1001)]
+        assert res == [{"startTime": i * 1000, "test_type": "test_templates_1"} for i in expected_range]
 
     def test_view_upsert(self, cognite_client, new_view):
         new_group, ext_id, new_version, view = new_view
@@ -4,7 +4,8 @@ from random import random
 
 import pytest
 
-from cognite.client.data_classes import Datapoints
+from cognite.client._api import synthetic_time_series
+from cognite.client.data_classes import Datapoints, DatapointsList
 from tests.utils import jsgz_load
 
 
@@ -81,7 +82,33 @@ class TestSyntheticQuery:
         )
         assert 20000 == len(dps_res[0])
         assert 20000 == len(dps_res[1])
-        assert 4 == len(mock_get_datapoints.calls)
+        assert 2 == len(mock_get_datapoints.calls)
+
+    def test_query_batches_expressions_in_each_request(self, cognite_client, mock_get_datapoints):
+        dps_res = cognite_client.time_series.data.synthetic.query(
+            expressions=[f"TS{{id:{i}}}" for i in range(12)], start=1000000, end=1015000
+        )
+        assert [15000] * 12 == [len(dps) for dps in dps_res]
+        assert [f"TS{{id:{i}}}" for i in range(12)] == [dps.external_id for dps in dps_res]
+        # 12 expressions fit in two batches (of 10 and 2), each needing two pages:
+        assert [10, 10, 2, 2] == sorted(
+            (len(jsgz_load(call.request.body)["items"]) for call in mock_get_datapoints.calls), reverse=True
+        )
+
+    def test_query_tuple_of_expressions(self, cognite_client, mock_get_datapoints):
+        dps_res = cognite_client.time_series.data.synthetic.query(
+            expressions=('TS{externalID:"abc"}', "TS{id:1}"), start=1000000, end=1000100
+        )
+        assert isinstance(dps_res, DatapointsList)
+        assert [100, 100] == [len(dps) for dps in dps_res]
+
+    @pytest.mark.parametrize("orjson_is_available", [True, False])
+    def test_query_with_and_without_orjson(self, cognite_client, mock_get_datapoints, monkeypatch, orjson_is_available):
+        if orjson_is_available:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(synthetic_time_series, "ORJSON_IS_AVAILABLE", orjson_is_available)
+        dps_res = cognite_client.time_series.data.synthetic.query(expressions="TS{id:1}", start=1000000, end=1000100)
+        assert 100 == len(dps_res)
 
     def test_query_empty(self, cognite_client, mock_get_datapoints_empty):
         dps_res = cognite_client.time_series.data.synthetic.query(
@@ -114,6 +141,12 @@ class TestSyntheticQuery:
             1 / symbols("a"), {"a": "a"}
         )
 
+    def test_expression_builder_substitutes_variables_in_single_pass(self, cognite_client):
+        assert (
+            "ts{externalId:'x'}+ts{externalId:'y'}*ts{externalId:'x'}",
+            "a+ts*a",
+        ) == cognite_client.time_series.data.synthetic._build_expression("a+ts*a", {"a": "x", "ts": "y"})
+
     @pytest.mark.dsl
     def test_expression_builder_variables_missing(self, cognite_client):
         from sympy import symbols
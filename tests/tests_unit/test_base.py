@@ -197,6 +197,9 @@ class TestCogniteResource:
         with pytest.raises(CogniteMissingClientError):
             MyResource(1)._cognite_client
         assert MyResource(1, cognite_client=c)._cognite_client == c
+        # The client is still kept in the instance dict:
+        assert vars(MyResource(1))["_cognite_client"] is None
+        assert vars(MyResource(1, cognite_client=c))["_cognite_client"] == c
 
     def test_use_method_which_requires_cognite_client__client_not_set(self):
         mr = MyResource()
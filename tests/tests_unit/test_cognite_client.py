@@ -3,7 +3,7 @@ import logging
 import pytest
 
 from cognite.client import ClientConfig, CogniteClient, global_config
-from cognite.client._api.assets import AssetList
+from cognite.client._api.assets import AssetList, AssetsAPI
 from cognite.client._api.files import FileMetadataList
 from cognite.client._api.time_series import TimeSeriesList
 from cognite.client.credentials import OAuthClientCredentials, Token
@@ -69,6 +69,13 @@ class TestCogniteClient:
         with pytest.raises(ValueError, match="No ClientConfig has been provided"):
             CogniteClient()
 
+    def test_apis_are_instantiated_once_on_first_access(self, client_config_w_token_factory):
+        c = CogniteClient(client_config_w_token_factory)
+        assert "assets" not in vars(c)
+        assets_api = c.assets
+        assert isinstance(assets_api, AssetsAPI)
+        assert c.assets is assets_api
+
     def test_client_debug_mode(self):
         CogniteClient(ClientConfig(client_name="bla", project="bla", credentials=Token("bla"), debug=True))
         log = logging.getLogger("cognite-sdk")
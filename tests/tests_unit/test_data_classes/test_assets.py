@@ -24,50 +24,50 @@ from tests.utils import rng_context
 
 
 class TestAsset:
-    def test_get_events(self, cognite_client):
-        cognite_client.events.list = mock.MagicMock()
+    def test_get_events(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.events, "list", mock.MagicMock())
         a = Asset(id=1, cognite_client=cognite_client)
         a.events()
         assert cognite_client.events.list.call_args == call(asset_ids=[1])
         assert cognite_client.events.list.call_count == 1
 
-    def test_get_time_series(self, cognite_client):
-        cognite_client.time_series.list = mock.MagicMock()
+    def test_get_time_series(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.time_series, "list", mock.MagicMock())
         a = Asset(id=1, cognite_client=cognite_client)
         a.time_series()
         assert cognite_client.time_series.list.call_args == call(asset_ids=[1])
         assert cognite_client.time_series.list.call_count == 1
 
-    def test_get_sequences(self, cognite_client):
-        cognite_client.sequences.list = mock.MagicMock()
+    def test_get_sequences(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.sequences, "list", mock.MagicMock())
         a = Asset(id=1, cognite_client=cognite_client)
         a.sequences()
         assert cognite_client.sequences.list.call_args == call(asset_ids=[1])
         assert cognite_client.sequences.list.call_count == 1
 
-    def test_get_files(self, cognite_client):
-        cognite_client.files.list = mock.MagicMock()
+    def test_get_files(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.files, "list", mock.MagicMock())
         a = Asset(id=1, cognite_client=cognite_client)
         a.files()
         assert cognite_client.files.list.call_args == call(asset_ids=[1])
         assert cognite_client.files.list.call_count == 1
 
-    def test_get_parent(self, cognite_client):
-        cognite_client.assets.retrieve = mock.MagicMock()
+    def test_get_parent(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.assets, "retrieve", mock.MagicMock())
         a1 = Asset(parent_id=1, cognite_client=cognite_client)
         a1.parent()
         assert cognite_client.assets.retrieve.call_args == call(id=1)
         assert cognite_client.assets.retrieve.call_count == 1
 
-    def test_get_children(self, cognite_client):
-        cognite_client.assets.list = mock.MagicMock()
+    def test_get_children(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.assets, "list", mock.MagicMock())
         a1 = Asset(id=1, cognite_client=cognite_client)
         a1.children()
         assert cognite_client.assets.list.call_args == call(parent_ids=[1], limit=None)
         assert cognite_client.assets.list.call_count == 1
 
-    def test_get_subtree(self, cognite_client):
-        cognite_client.assets.retrieve_subtree = mock.MagicMock()
+    def test_get_subtree(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.assets, "retrieve_subtree", mock.MagicMock())
         a1 = Asset(id=1, cognite_client=cognite_client)
         a1.subtree(depth=1)
         assert cognite_client.assets.retrieve_subtree.call_args == call(id=1, depth=1)
@@ -75,29 +75,29 @@ class TestAsset:
 
 
 class TestAssetList:
-    def test_get_events(self, cognite_client):
-        cognite_client.events.list = mock.MagicMock()
+    def test_get_events(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.events, "list", mock.MagicMock())
         a = AssetList(resources=[Asset(id=1)], cognite_client=cognite_client)
         a.events()
         assert cognite_client.events.list.call_args == call(asset_ids=[1], limit=-1)
         assert cognite_client.events.list.call_count == 1
 
-    def test_get_time_series(self, cognite_client):
-        cognite_client.time_series.list = mock.MagicMock()
+    def test_get_time_series(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.time_series, "list", mock.MagicMock())
         a = AssetList(resources=[Asset(id=1)], cognite_client=cognite_client)
         a.time_series()
         assert cognite_client.time_series.list.call_args == call(asset_ids=[1], limit=-1)
         assert cognite_client.time_series.list.call_count == 1
 
-    def test_get_sequences(self, cognite_client):
-        cognite_client.sequences.list = mock.MagicMock()
+    def test_get_sequences(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.sequences, "list", mock.MagicMock())
         a = AssetList(resources=[Asset(id=1)], cognite_client=cognite_client)
         a.sequences()
         assert cognite_client.sequences.list.call_args == call(asset_ids=[1], limit=-1)
         assert cognite_client.sequences.list.call_count == 1
 
-    def test_get_files(self, cognite_client):
-        cognite_client.files.list = mock.MagicMock()
+    def test_get_files(self, cognite_client, monkeypatch):
+        monkeypatch.setattr(cognite_client.files, "list", mock.MagicMock())
         a = AssetList(resources=[Asset(id=1)], cognite_client=cognite_client)
         a.files()
         assert cognite_client.files.list.call_args == call(asset_ids=[1], limit=-1)
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from cognite.client.data_classes import ConstantResolver, Source, TemplateInstance, TemplateInstanceList, View
+from cognite.client.data_classes.templates import SyntheticTimeSeriesResolver, TemplateInstanceUpdate, ViewResolveList
+from cognite.client.utils._auxiliary import json_dump_default
+
+
+class TestTemplateInstance:
+    def test_dump(self):
+        instance = TemplateInstance(
+            external_id="pump-1",
+            template_name="Pump",
+            field_resolvers={
+                "name": ConstantResolver("Pump 1"),
+                "pressure": SyntheticTimeSeriesResolver(expression="ts{externalId='p1'} * 2", is_step=False),
+                "asset": "pump-asset",
+            },
+            data_set_id=123,
+        )
+        assert instance.dump(camel_case=True) == {
+            "externalId": "pump-1",
+            "templateName": "Pump",
+            "fieldResolvers": {
+                "name": {"type": "constant", "value": "Pump 1"},
+                "pressure": {"type": "syntheticTimeSeries", "expression": "ts{externalId='p1'} * 2", "isStep": False},
+                "asset": "pump-asset",
+            },
+            "dataSetId": 123,
+        }
+        assert instance.dump(camel_case=False)["field_resolvers"]["pressure"] == {
+            "type": "syntheticTimeSeries",
+            "expression": "ts{externalId='p1'} * 2",
+            "is_step": False,
+        }
+
+    def test_load_dump_roundtrip(self):
+        resource = {
+            "externalId": "pump-1",
+            "templateName": "Pump",
+            "fieldResolvers": {
+                "name": {"type": "constant", "value": "Pump 1"},
+                "location": {
+                    "type": "raw",
+                    "dbName": "db",
+                    "tableName": "table",
+                    "rowKey": "pump-1",
+                    "columnName": "location",
+                },
+            },
+            "dataSetId": 123,
+            "createdTime": 1,
+            "lastUpdatedTime": 2,
+        }
+        instances = TemplateInstanceList._load([resource])
+        name_resolver = instances[0].field_resolvers["name"]
+        assert isinstance(name_resolver, ConstantResolver)
+        assert name_resolver.type == "constant"
+        assert instances.dump(camel_case=True) == [resource]
+
+
+class TestTemplateInstanceUpdate:
+    def test_dump_serializes_resolver_type(self):
+        update = TemplateInstanceUpdate(external_id="norway").field_resolvers.add({"name": ConstantResolver("Patched")})
+        dumped = json.loads(json.dumps(update.dump(), default=json_dump_default))
+        assert dumped["update"]["fieldResolvers"]["add"]["name"]["type"] == "constant"
+        assert dumped["update"]["fieldResolvers"]["add"]["name"]["value"] == "Patched"
+
+
+class TestView:
+    def test_load_dump_roundtrip(self):
+        resource = {
+            "externalId": "pumps",
+            "source": {"type": "assets", "filter": {"name": "$name"}, "mappings": {"pumpName": "name"}},
+            "createdTime": 1,
+        }
+        view = View._load(resource)
+        assert isinstance(view.source, Source)
+        assert view.source.filter == {"name": "$name"}
+        assert view.dump(camel_case=True) == resource
+        assert view.dump(camel_case=False) == {
+            "external_id": "pumps",
+            "source": {"type": "assets", "filter": {"name": "$name"}, "mappings": {"pumpName": "name"}},
+            "created_time": 1,
+        }
+
+    def test_load_from_json_string(self):
+        assert View._load('{"externalId": "pumps", "dataSetId": 1}') == View(external_id="pumps", data_set_id=1)
+        with pytest.raises(TypeError, match="^Resource must be json str or dict, not <class 'list'>$"):
+            View._load("[1, 2]")
+
+    def test_load_ignores_unknown_keys(self):
+        view = View._load({"externalId": "pumps", "data_set_id": 1, "unknownField": 2, "dump": 3})
+        assert view.dump(camel_case=True) == {"externalId": "pumps", "dataSetId": 1}
+        assert not hasattr(view, "unknown_field")
+
+    def test_dump_and_load_include_every_attribute_set_in_init(self):
+        class ViewWithExtraField(View):
+            def __init__(self, *args, extra_field=None, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.extra_field = extra_field
+
+        view = ViewWithExtraField._load({"externalId": "pumps", "extraField": 1})
+        assert view.extra_field == 1
+        assert view.dump(camel_case=True) == {"externalId": "pumps", "extraField": 1}
+        assert view.dump(camel_case=False) == {"external_id": "pumps", "extra_field": 1}
+
+
+class TestViewResolveItem:
+    def test_load_dump(self):
+        items = ViewResolveList._load([{"name": "pump-1", "pressure": {"value": 2.5}}])
+        assert items[0]["pressure"] == {"value": 2.5}
+        assert isinstance(items[0], dict)
+        assert items.dump() == [{"name": "pump-1", "pressure": {"value": 2.5}}]
+        assert type(items[0].dump()) is dict
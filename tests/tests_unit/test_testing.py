@@ -1,3 +1,6 @@
+from functools import cached_property
+from unittest.mock import MagicMock, seal
+
 import pytest
 
 from cognite.client import ClientConfig, CogniteClient
@@ -7,17 +10,30 @@ from cognite.client.testing import CogniteClientMock, monkeypatch_cognite_client
 from tests.utils import all_mock_children, all_subclasses
 
 
+def mock_with_all_apis_accessed():
+    # The API mocks are created lazily, on first access:
+    c_mock = CogniteClientMock()
+    for name, attr in vars(CogniteClient).items():
+        if isinstance(attr, cached_property):
+            getattr(c_mock, name)
+    return c_mock
+
+
+# Both tests below inspect the same mock, so we only build it (with every API accessed) once:
+ALL_MOCKED_APIS = all_mock_children(mock_with_all_apis_accessed())
+# All API modules have been imported by cognite.client.testing at this point:
+EXPECTED_APIS = frozenset(all_subclasses(APIClient))
+
+
 def test_ensure_all_apis_are_available_on_cognite_mock():
-    mocked_apis = all_mock_children(CogniteClientMock())
-    available = {v.__class__ for v in mocked_apis.values()}
-    expected = set(all_subclasses(APIClient))
+    available = {v.__class__ for v in ALL_MOCKED_APIS.values()}
     # Any new APIs that have not been added to CogniteClientMock?
-    assert not expected.difference(available)
+    assert not EXPECTED_APIS.difference(available)
     # Any removed APIs that are still available on CogniteClientMock?
-    assert not available.difference(expected)
+    assert not available.difference(EXPECTED_APIS)
 
 
-@pytest.mark.parametrize("api", list(all_mock_children(CogniteClientMock()).values()))
+@pytest.mark.parametrize("api", list(ALL_MOCKED_APIS.values()))
 def test_ensure_all_apis_are_specced_on_cognite_mock(api):
     # All APIs raise when trying to access a non-existing attribute:
     with pytest.raises(AttributeError):
@@ -39,6 +55,52 @@ def test_cognite_client_accepts_arguments_during_and_after_mock():
     CogniteClient(ClientConfig(client_name="bla", project="bla", credentials=Token("bla")))
 
 
+def test_monkeypatch_cognite_client_without_strict_spec():
+    with monkeypatch_cognite_client(strict_spec=False) as c_mock:
+        assert isinstance(c_mock, CogniteClientMock)
+        c_mock.iam.token.inspect.return_value = "subject"
+        assert CogniteClient().iam.token.inspect() == "subject"
+        # Only the client itself is specced:
+        CogniteClient().assets.does_not_exist
+        with pytest.raises(AttributeError):
+            CogniteClient().does_not_exist
+
+
 def test_client_mock_can_access_attributes_not_explicitly_defined_on_children():
     c_mock = CogniteClientMock()
     assert c_mock.config.max_workers
+
+
+def test_client_mock_creates_api_mocks_on_first_access():
+    c_mock = CogniteClientMock()
+    assert "assets" not in c_mock._mock_children
+    assert c_mock.assets is c_mock.assets
+    assert "assets" in c_mock._mock_children
+    assert "time_series" not in c_mock._mock_children
+
+
+def test_client_mock_can_be_sealed():
+    c_mock = CogniteClientMock()
+    c_mock.time_series.data.retrieve.return_value = 42
+    seal(c_mock)
+    assert c_mock.time_series.data.retrieve() == 42
+    assert isinstance(c_mock.assets, MagicMock)
+    # Sealed mocks do not create new children, also not for APIs accessed for the first time after sealing:
+    with pytest.raises(AttributeError):
+        c_mock.time_series.data.retrieve_arrays
+    with pytest.raises(AttributeError):
+        c_mock.assets.list
+    with pytest.raises(AttributeError):
+        c_mock.does_not_exist
+
+
+def test_client_mock_deleted_api_stays_deleted():
+    c_mock = CogniteClientMock()
+    c_mock.assets
+    del c_mock.assets
+    with pytest.raises(AttributeError):
+        c_mock.assets
+    # ...also when the API was never accessed before being deleted:
+    del c_mock.time_series
+    with pytest.raises(AttributeError):
+        c_mock.time_series
@@ -1,6 +1,11 @@
+import gc
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 
+import pytest
+
 from cognite.client.utils._concurrency import ConcurrencySettings, MainThreadExecutor, execute_tasks, get_executor
+from cognite.client.utils._priority_tpe import PriorityThreadPoolExecutor
 
 
 class TestExecutor:
@@ -22,3 +27,40 @@ class TestExecutor:
 
         task_summary = execute_tasks(foo, [(i,) for i in range(10)], 10, executor=MainThreadExecutor())
         assert task_summary.results == [i for i in range(10)]
+
+    @pytest.mark.parametrize("executor_cls", (MainThreadExecutor, PriorityThreadPoolExecutor))
+    def test_submit_rejects_functions_with_priority_parameter(self, executor_cls) -> None:
+        class Task:
+            def run(self, priority: int) -> int:
+                return priority
+
+        executor = executor_cls()
+        for _ in range(2):  # The second call is answered from the cache
+            with pytest.raises(TypeError, match="reserved parameter name `priority`"):
+                executor.submit(Task().run, 1)
+        assert executor.submit(lambda i: i, 1, priority=1).result() == 1
+        executor.shutdown()
+
+    @pytest.mark.parametrize("executor_cls", (MainThreadExecutor, PriorityThreadPoolExecutor))
+    def test_submit_does_not_keep_closures_alive(self, executor_cls) -> None:
+        class State:
+            pass
+
+        def make_closure(state):
+            return lambda i: (state, i)
+
+        executor = executor_cls()
+        state = State()
+        state_ref = weakref.ref(state)
+        executor.submit(make_closure(state), 1).result()
+        executor.shutdown()
+        del state, executor
+        gc.collect()
+        assert state_ref() is None
+
+    def test_main_thread_executor_as_completed_allows_removing_futures(self) -> None:
+        executor = MainThreadExecutor()
+        futures = {executor.submit(lambda i: i, i): i for i in range(5)}
+        for future in executor.as_completed(futures):
+            assert future.result() == futures.pop(future)
+        assert not futures
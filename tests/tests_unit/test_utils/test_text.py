@@ -8,6 +8,7 @@ from cognite.client.utils._text import (
     iterable_to_case,
     random_string,
     shorten,
+    shorten_str,
     to_camel_case,
     to_snake_case,
 )
@@ -34,6 +35,18 @@ def test_shorten(obj, width, placeholder, expected):
     assert expected == shorten(obj, width, placeholder)
 
 
+@pytest.mark.parametrize(
+    "s, width, expected",
+    (
+        (ascii_lowercase, 26, ascii_lowercase),
+        (ascii_lowercase, 25, "abcdefghijklmnopqrstuv..."),
+        ("", 3, ""),
+    ),
+)
+def test_shorten_str(s, width, expected):
+    assert expected == shorten_str(s, width) == shorten(s, width)
+
+
 def test_shorten__fails():
     with pytest.raises(ValueError, match="^Width must be larger than "):
         shorten(object(), width=2, placeholder="...")
@@ -57,6 +70,18 @@ def test_to_camel_case(inp, expected):
         ("snakeCase", "snake_case"),
         ("snake_case", "snake_case"),
         ("a", "a"),
+        ("", ""),
+        ("A", "a"),
+        ("externalId", "external_id"),
+        ("dataSetId", "data_set_id"),
+        ("HTTPResponse", "http_response"),
+        ("getHTTPResponseCode", "get_http_response_code"),
+        ("ts1Value", "ts1_value"),
+        ("a1B", "a1_b"),
+        ("already_Snake", "already__snake"),
+        ("ABC", "abc"),
+        ("aBC", "a_bc"),
+        ("aBcDe", "a_bc_de"),
     ),
 )
 def test_to_snake_case(inp, expected):